@@ -0,0 +1,60 @@
+# Copyright 2024 The KServe Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+
+import pytest
+
+
+def load_model(model_path):
+    """Import the model class lazily so that collecting this module does not
+    pull in kserve and its kubernetes dependencies"""
+    module_name, class_name = model_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def make_instance(model_cls, required, optional):
+    """Construct the model once with only the required params and once with
+    both the required and optional params"""
+    inst_req_only = model_cls(**required)
+    inst_req_and_optional = model_cls(**required, **optional)
+    return inst_req_only, inst_req_and_optional
+
+
+@pytest.mark.parametrize(
+    "model_path,required,optional",
+    [
+        (
+            "kserve.models.v1alpha1_built_in_adapter.V1alpha1BuiltInAdapter",
+            {},
+            dict(
+                mem_buffer_bytes=56,
+                model_loading_timeout_millis=56,
+                runtime_management_port=56,
+                server_type="0",
+            ),
+        ),
+        (
+            "kserve.models.v1beta1_deploy_config.V1beta1DeployConfig",
+            {},
+            dict(default_deployment_mode="0"),
+        ),
+    ],
+)
+def test_model(model_path, required, optional):
+    model_cls = load_model(model_path)
+    inst_req_only, inst_req_and_optional = make_instance(model_cls, required, optional)
+    assert inst_req_only == model_cls(**required)
+    for name, value in optional.items():
+        assert getattr(inst_req_and_optional, name) == value
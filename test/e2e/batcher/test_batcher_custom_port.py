@@ -11,11 +11,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import json
 from kubernetes import client
 
-from kserve import KServeClient
 from kserve import constants
 from kserve import V1beta1PredictorSpec
 from kserve import V1beta1Batcher
@@ -29,15 +27,13 @@ from ..common.utils import predict_str
 from ..common.utils import KSERVE_TEST_NAMESPACE
 from concurrent import futures
 
-kserve_client = KServeClient(config_file=os.environ.get("KUBECONFIG", "~/.kube/config"))
-
 
 input_file = open("./data/iris_batch_input.json")
 json_array = json.load(input_file)
 
 
 @pytest.mark.predictor
-def test_batcher_custom_port():
+def test_batcher_custom_port(kserve_client):
     service_name = "isvc-sklearn-batcher-custom"
 
     predictor = V1beta1PredictorSpec(
@@ -10,11 +10,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import json
 from kubernetes import client
 
-from kserve import KServeClient
 from kserve import constants
 from kserve import V1beta1PredictorSpec
 from kserve import V1beta1Batcher
@@ -28,15 +26,13 @@ from ..common.utils import predict_str
 from ..common.utils import KSERVE_TEST_NAMESPACE
 from concurrent import futures
 
-kserve_client = KServeClient(config_file=os.environ.get("KUBECONFIG", "~/.kube/config"))
-
 
 input_file = open("./data/iris_batch_input.json")
 json_array = json.load(input_file)
 
 
 @pytest.mark.raw
-def test_batcher_raw():
+def test_batcher_raw(kserve_client):
     service_name = "isvc-raw-sklearn-batcher"
 
     annotations = dict()
@@ -13,11 +13,9 @@
 
 
 import logging
-import os
 
 from kubernetes import client
 
-from kserve import KServeClient
 from kserve import constants
 from kserve import V1beta1PredictorSpec
 from kserve import V1beta1InferenceServiceSpec
@@ -32,11 +30,9 @@ from ..common.utils import predict
 from ..common.utils import explain_art
 from ..common.utils import KSERVE_TEST_NAMESPACE
 
-kserve_client = KServeClient(config_file=os.environ.get("KUBECONFIG", "~/.kube/config"))
-
 
 @pytest.mark.explainer
-def test_tabular_explainer():
+def test_tabular_explainer(kserve_client):
     service_name = "art-explainer"
     isvc = V1beta1InferenceService(
         api_version=constants.KSERVE_V1BETA1,
@@ -11,10 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 from kubernetes import client
 
-from kserve import KServeClient
 from kserve import constants
 from kserve import V1beta1PredictorSpec
 from kserve import V1beta1SKLearnSpec
@@ -28,11 +26,9 @@ from ..common.utils import predict
 from ..common.utils import KSERVE_TEST_NAMESPACE
 import time
 
-kserve_client = KServeClient(config_file=os.environ.get("KUBECONFIG", "~/.kube/config"))
-
 
 @pytest.mark.raw
-def test_kserve_logger():
+def test_kserve_logger(kserve_client):
     msg_dumper = "message-dumper-raw"
     annotations = {"serving.kserve.io/deploymentMode": "RawDeployment"}
 